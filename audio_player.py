@@ -5,13 +5,18 @@ This module handles audio file playback and management of audio files
 associated with RFID tags.
 """
 
+import functools
+import logging
 import os
+import queue
 import threading as th
 import time
-from threading import Event, Lock
+from threading import Event, RLock
 from dotenv import load_dotenv
 
 import pygame as pg
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from logger import get_logger
 from model import RFIDAudio, Session
@@ -20,6 +25,15 @@ logger = get_logger(__name__)
 
 load_dotenv()
 
+# Ignore re-reads of the tag that was just played for this many seconds
+PLAY_DEBOUNCE_SECONDS = 2.0
+
+# Compared against the lowercased filename
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".ogg", ".flac")
+
+# Built once so SQLAlchemy can reuse the compiled statement
+_ALL_MAPPINGS = select(RFIDAudio.id, RFIDAudio.file)
+
 
 class AudioPlayer:
     """
@@ -41,13 +55,20 @@ class AudioPlayer:
         self.current_output_device = os.getenv("DEFAULT_AUDIO_DEVICE", "speaker")
         self._initialize_audio(self.current_output_device)
 
-        self.session = Session()
-        self.audio_lock = Lock()
-        self.current_audio = None
+        self.audio_lock = RLock()
+        # Called with no arguments whenever current_audio changes
+        self.track_change_handler = None
+        self._current_audio = None
         self.playback_event = Event()
         self.reader_active = True
         self.media_path = media_path
-        self.audio_thread = None
+        self._last_file = None
+        self._last_tag = None  # Tag currently on the reader, if any
+        self._file_cache = None  # (directory mtime_ns, sorted filenames)
+
+        # In-memory copy of the tag mapping table, read by the player thread
+        self._tag_lock = RLock()
+        self._tag_index = self._load_tag_index()
 
         # Initialize volume to default value
         default_volume = int(os.getenv("DEFAULT_VOLUME", "25"))
@@ -55,6 +76,13 @@ class AudioPlayer:
         self.set_volume(default_volume)
         logger.info(f"Volume initialized to {default_volume}%")
 
+        # A single long-lived worker plays queued files one at a time
+        self._play_queue = queue.Queue(maxsize=1)
+        # Bumped by every stop(); queued files from an older generation are dropped
+        self._generation = 0
+        self.audio_thread = th.Thread(target=self._run, daemon=True)
+        self.audio_thread.start()
+
     def _initialize_audio(self, device):
         """
         Internal helper to set environment and initialize mixer.
@@ -67,6 +95,8 @@ class AudioPlayer:
             bool: True if initialization successful, False otherwise
         """
         logger.info(f"Initializing audio for device: {device}")
+        # Quitting the mixer drops whatever music was loaded
+        self._loaded_music = None
 
         try:
             if pg.mixer.get_init():
@@ -152,18 +182,25 @@ class AudioPlayer:
 
             # Update current audio info
             self.current_audio = audio_file
+            self._last_file = audio_file
 
-            # Start new audio playback
-            self.playback_event.clear()
-            self.audio_thread = th.Thread(target=self._play_audio, args=(audio_file,))
-            self.audio_thread.daemon = (
-                True  # Make thread daemon so it exits when main program exits
-            )
-            self.audio_thread.start()
+            # Hand the file to the playback worker
+            self._play_queue.put((self._generation, audio_file))
+
+    def _run(self):
+        """Worker loop that plays queued audio files until the process exits."""
+        while True:
+            generation, audio_file = self._play_queue.get()
+            with self.audio_lock:
+                # stop() ran between get() and here; the file is cancelled
+                if generation != self._generation:
+                    continue
+                self.playback_event.clear()
+            self._play_audio(audio_file)
 
     def _play_audio(self, audio_file):
         """
-        Internal method to play audio in a separate thread.
+        Internal method to play audio on the playback worker thread.
 
         Args:
             audio_file (str): The audio file to play
@@ -171,49 +208,61 @@ class AudioPlayer:
         try:
             full_path = os.path.join(self.media_path, audio_file)
             logger.info(f"[PLAYBACK] Starting playback thread for: {audio_file}")
-            logger.debug(f"[PLAYBACK] Full path: {full_path}")
+            logger.debug("[PLAYBACK] Full path: %s", full_path)
 
             # Check if file exists before trying to play it
-            if not os.path.exists(full_path):
+            try:
+                stat = os.stat(full_path)
+            except FileNotFoundError:
                 logger.error(f"Audio file not found: {full_path}")
                 with self.audio_lock:
                     self.current_audio = f"File not found: {audio_file}"
                 return
 
-            # Check file size and permissions
-            file_size = os.path.getsize(full_path)
-            logger.debug(f"[PLAYBACK] File size: {file_size} bytes")
+            logger.debug("[PLAYBACK] File size: %d bytes", stat.st_size)
             
             # Check if mixer is initialized
             if not pg.mixer.get_init():
                 logger.error(f"[PLAYBACK] Mixer not initialized!")
                 return
                 
-            logger.debug(f"[PLAYBACK] Mixer initialized: {pg.mixer.get_init()}")
-
-            # Load and play
-            logger.debug(f"[PLAYBACK] Loading audio file...")
-            pg.mixer.music.load(full_path)
-            logger.debug(f"[PLAYBACK] Audio file loaded successfully")
+            logger.debug("[PLAYBACK] Mixer initialized: %s", pg.mixer.get_init())
+
+            # Load and play; re-tapping the same tag skips the decoder setup
+            music_key = (full_path, stat.st_mtime_ns)
+            if music_key != self._loaded_music:
+                logger.debug("[PLAYBACK] Loading audio file...")
+                self._loaded_music = None
+                pg.mixer.music.load(full_path)
+                self._loaded_music = music_key
+                logger.debug("[PLAYBACK] Audio file loaded successfully")
+            else:
+                logger.debug("[PLAYBACK] Reusing loaded audio file")
             
-            logger.debug(f"[PLAYBACK] Starting playback...")
+            logger.debug("[PLAYBACK] Starting playback...")
             pg.mixer.music.play()
             logger.info(f"[PLAYBACK] Playback started for: {audio_file}")
 
-            # Keep thread alive until playback finishes or is interrupted
-            tick_count = 0
-            while pg.mixer.music.get_busy() and not self.playback_event.is_set():
-                pg.time.Clock().tick(10)
-                tick_count += 1
-                # Log every 5 seconds (50 ticks at 10 Hz)
-                if tick_count % 50 == 0:
-                    logger.debug(f"[PLAYBACK] Still playing... ({tick_count // 10}s elapsed)")
+            # Keep thread alive until playback finishes or is interrupted;
+            # stop() sets playback_event, which ends the wait immediately
+            wait_count = 0
+            while pg.mixer.music.get_busy():
+                if self.playback_event.wait(0.5):
+                    break
+                wait_count += 1
+                # Log every 5 seconds (10 waits of 0.5 s)
+                if wait_count % 10 == 0 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[PLAYBACK] Still playing... (%ds elapsed)", wait_count // 2
+                    )
             
             # Log why we exited the loop
             if not pg.mixer.music.get_busy():
                 logger.info(f"[PLAYBACK] Playback completed naturally for: {audio_file}")
             elif self.playback_event.is_set():
                 logger.info(f"[PLAYBACK] Playback interrupted by stop event for: {audio_file}")
+                # stop() may have run before play() was reached
+                pg.mixer.music.stop()
 
         except Exception as e:
             logger.error(f"[PLAYBACK] Audio playback error: {str(e)}", exc_info=True)
@@ -224,53 +273,115 @@ class AudioPlayer:
                     self.current_audio = None
             logger.info(f"[PLAYBACK] Playback thread finished for: {audio_file}")
 
+    def _prefetch(self, path):
+        """
+        Ask the kernel to read the start of an audio file into the page cache.
+
+        Used when a tag is removed so that re-tapping it starts playback
+        from memory instead of waiting on the SD card.
+
+        Args:
+            path (str): Full path of the file to prefetch
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError as e:
+            logger.debug("Could not open %s for prefetch: %s", path, e)
+            return
+
+        try:
+            size = os.fstat(fd).st_size
+            os.posix_fadvise(fd, 0, min(size, 1 << 20), os.POSIX_FADV_WILLNEED)
+            logger.debug("Prefetched %s", path)
+        except OSError as e:
+            logger.debug("Prefetch failed for %s: %s", path, e)
+        finally:
+            os.close(fd)
+
     def stop(self):
         """Stop any currently playing audio."""
-        # Set the event to signal thread to stop
-        self.playback_event.set()
+        with self.audio_lock:
+            # Drop a file that was queued but not started yet
+            try:
+                self._play_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            # Cancel a file the worker has taken but not started yet
+            self._generation += 1
+
+            # Set the event to signal the worker to stop
+            self.playback_event.set()
 
         # Stop pygame playback
         try:
             pg.mixer.music.stop()
             logger.debug("Stopped audio playback")
         except Exception as e:
-            logger.debug(f"Error stopping playback: {str(e)}")
+            logger.debug("Error stopping playback: %s", e)
 
-        # Wait for thread to finish if it exists and is alive
-        if self.audio_thread and self.audio_thread.is_alive():
-            self.audio_thread.join(timeout=1.0)  # Wait with timeout
+    def _load_tag_index(self):
+        """
+        Read every RFID mapping from the database.
+
+        Returns:
+            dict: Mapping of RFID tag ID strings to audio filenames
+        """
+        with Session() as session:
+            index = {
+                str(tag_id): file for tag_id, file in session.execute(_ALL_MAPPINGS)
+            }
+        logger.info(f"Loaded {len(index)} RFID mappings")
+        return index
 
     def get_file(self, file_id):
         """
         Get the audio filename associated with an RFID ID.
 
         Args:
-            file_id (str): The RFID tag ID to look up
+            file_id (str or int): The RFID tag ID to look up
 
         Returns:
             str or None: The associated audio filename or None if not found
         """
-        record = self.session.query(RFIDAudio).filter_by(id=file_id).first()
-        return record.file if record else None
+        with self._tag_lock:
+            return self._tag_index.get(str(file_id))
 
     def get_files_in_folder(self):
         """
-        Get a list of all audio files in the media directory.
+        Get a sorted list of all audio files in the media directory.
+
+        The listing is cached and only rebuilt when the directory's
+        modification time changes.
 
         Returns:
-            list: A list of filenames in the media directory
+            list: A list of audio filenames in the media directory
         """
         folder_path = self.media_path
-        if not os.path.exists(folder_path):
+        try:
+            mtime = os.stat(folder_path).st_mtime_ns
+            if self._file_cache and self._file_cache[0] == mtime:
+                return self._file_cache[1]
+
+            # DirEntry.is_file() uses the type from readdir and only stats
+            # symlinks, which are followed like os.path.isfile did
+            with os.scandir(folder_path) as entries:
+                files = sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.is_file()
+                    and entry.name.lower().endswith(AUDIO_EXTENSIONS)
+                )
+        except FileNotFoundError:
             logger.warning(f"Media directory not found: {folder_path}")
+            self._file_cache = None
             return []
 
-        files = [
-            file
-            for file in os.listdir(folder_path)
-            if os.path.isfile(os.path.join(folder_path, file))
-        ]
-        logger.debug(f"Found {len(files)} files in {folder_path}")
+        self._file_cache = (mtime, files)
+        logger.debug("Found %d files in %s", len(files), folder_path)
         return files
 
     def add_file_to_db(self, file_id, file_name):
@@ -281,17 +392,44 @@ class AudioPlayer:
             file_id (str): The RFID tag ID
             file_name (str): The audio filename to associate with the ID
         """
-        record = self.session.query(RFIDAudio).filter_by(id=file_id).first()
-        if record:
+        file_id = str(file_id)
+        # The index mirrors the table, so it tells us whether this is an update
+        previous = self.get_file(file_id)
+        if previous:
             logger.info(
-                f"Updating RFID mapping: ID {file_id} from {record.file} to {file_name}"
+                f"Updating RFID mapping: ID {file_id} from {previous} to {file_name}"
             )
-            record.file = file_name
         else:
             logger.info(f"Adding new RFID mapping: ID {file_id} to {file_name}")
-            record = RFIDAudio(id=file_id, file=file_name)
-            self.session.add(record)
-        self.session.commit()
+
+        with Session() as session, session.begin():
+            if session.get_bind().dialect.name == "sqlite":
+                # One INSERT ... ON CONFLICT DO UPDATE instead of SELECT + write
+                stmt = sqlite_insert(RFIDAudio).values(id=file_id, file=file_name)
+                session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[RFIDAudio.id],
+                        set_={"file": stmt.excluded.file},
+                    )
+                )
+            else:
+                session.merge(RFIDAudio(id=file_id, file=file_name))
+
+        with self._tag_lock:
+            self._tag_index[file_id] = file_name
+
+    @property
+    def current_audio(self):
+        """str or None: The current audio filename or status text."""
+        return self._current_audio
+
+    @current_audio.setter
+    def current_audio(self, value):
+        if value == self._current_audio:
+            return
+        self._current_audio = value
+        if self.track_change_handler:
+            self.track_change_handler()
 
     def get_current_audio(self):
         """
@@ -300,8 +438,9 @@ class AudioPlayer:
         Returns:
             str or None: The currently playing audio filename or None
         """
-        with self.audio_lock:
-            return self.current_audio
+        # A single attribute read is atomic; taking audio_lock here would
+        # stall the UI while the player thread is stopping the mixer
+        return self._current_audio
 
     def switch_audio_output(self, output_device):
         """
@@ -361,7 +500,7 @@ class AudioPlayer:
             pg.mixer.music.set_volume(volume)
 
             self.current_volume = volume_percent
-            logger.debug(f"Volume set to {volume_percent}%")
+            logger.debug("Volume set to %d%%", volume_percent)
 
             return True
         except Exception as e:
@@ -399,42 +538,57 @@ class AudioPlayer:
             shutdown_event: Event to monitor for shutdown signals
         """
         logger.info("Starting RFID player loop")
-        current_id = 0
+        self._last_tag = None
         none_counter = 0
+        last_played_id = None
+        last_play_ts = 0.0
 
         while not shutdown_event.is_set():
             if not self.reader_active:
-                time.sleep(0.1)
+                shutdown_event.wait(0.1)
                 continue
 
             try:
-                id_val, text = rfid_reader.read_tag_no_block()
-                if id_val is not None:
-                    if id_val != current_id:
-                        current_id = id_val
-                        logger.info(f"New RFID tag detected: {id_val}")
-                        self.play(str(id_val))
-                        time.sleep(2)  # Debounce time
-
+                # The player only needs the tag ID, not its data block
+                id_val = rfid_reader.read_tag_id_no_block()
                 if id_val is None:
                     none_counter += 1
+                elif id_val == self._last_tag:
+                    # Same tag still on the reader, nothing to look up
+                    none_counter = 0
                 else:
                     none_counter = 0
+                    now = time.monotonic()
+                    if (
+                        id_val == last_played_id
+                        and now - last_play_ts < PLAY_DEBOUNCE_SECONDS
+                    ):
+                        logger.debug("Debouncing repeated read of tag %s", id_val)
+                    else:
+                        self._last_tag = id_val
+                        logger.info(f"New RFID tag detected: {id_val}")
+                        self.play(id_val)
+                        last_played_id = id_val
+                        last_play_ts = now
 
                 # Stop playback if tag is removed (multiple empty reads)
                 if none_counter >= 2:
-                    logger.debug(f"RFID tag removed: {current_id}")
+                    logger.debug("RFID tag removed: %s", self._last_tag)
                     self.stop()
+                    if self._last_tag and self._last_file:
+                        # Warm the page cache in case the tag is put back
+                        self._prefetch(os.path.join(self.media_path, self._last_file))
                     none_counter = 0
-                    current_id = 0
+                    self._last_tag = None
             except Exception as e:
                 logger.error(f"Error in RFID reading loop: {str(e)}")
                 # Reset counters on error
                 none_counter = 0
-                current_id = 0
-                time.sleep(1)
+                self._last_tag = None
+                shutdown_event.wait(1)
 
-            time.sleep(0.1)
+            # Wakes immediately when shutdown is requested
+            shutdown_event.wait(0.1)
 
     def __del__(self):
         """Clean up resources when object is destroyed."""
@@ -443,9 +597,15 @@ class AudioPlayer:
             self.stop()
             pg.mixer.quit()
         except Exception as e:
-            logger.debug(f"Error during cleanup: {str(e)}")
+            logger.debug("Error during cleanup: %s", e)
 
-        try:
-            self.session.close()
-        except Exception as e:
-            logger.debug(f"Error closing session: {str(e)}")
+
+@functools.cache
+def get_player():
+    """
+    Get the shared AudioPlayer instance, creating it on first use.
+
+    Returns:
+        AudioPlayer: The process-wide audio player
+    """
+    return AudioPlayer()
@@ -12,23 +12,46 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-LOG_DIR = os.getenv("LOG_DIR")
-LOG_FILE = os.path.join(LOG_DIR, "rfid_player.log")
-
-os.makedirs(LOG_DIR, exist_ok=True)
-
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)  # Default level
 
 log_format = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
-file_handler = RotatingFileHandler(LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=10)
-file_handler.setFormatter(log_format)
-logger.addHandler(file_handler)
+_configured = False
+
+
+def _ensure():
+    """
+    Attach the file and console handlers to the root logger once.
+
+    Handler setup is deferred until the first logger is requested so that
+    importing this module does not touch the filesystem.
+    """
+    global _configured
+    if _configured:
+        return
+
+    # The module may be imported under more than one name; attach once
+    if not any(isinstance(h, RotatingFileHandler) for h in logger.handlers):
+        log_dir = os.getenv("LOG_DIR", "logs")
+        os.makedirs(log_dir, exist_ok=True)
+
+        file_handler = RotatingFileHandler(
+            os.path.join(log_dir, "rfid_player.log"),
+            maxBytes=5 * 1024 * 1024,
+            backupCount=10,
+        )
+        file_handler.setFormatter(log_format)
+        logger.addHandler(file_handler)
+
+    # Under systemd, stderr is what ends up in the journal
+    has_console = any(type(h) is logging.StreamHandler for h in logger.handlers)
+    if not has_console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(log_format)
+        logger.addHandler(console_handler)
 
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(log_format)
-logger.addHandler(console_handler)
+    _configured = True
 
 
 def get_logger(name=None):
@@ -41,6 +64,7 @@ def get_logger(name=None):
     Returns:
         logging.Logger: A configured logger instance
     """
+    _ensure()
     if name:
         return logging.getLogger(name)
     return logger
@@ -53,6 +77,7 @@ def set_log_level(level):
     Args:
         level: Logging level (e.g., logging.DEBUG, logging.INFO)
     """
+    _ensure()
     logger.setLevel(level)
     for handler in logger.handlers:
         handler.setLevel(level)
@@ -4,13 +4,18 @@ Database models for the RFID Audio Player application.
 This module defines the database schema and provides connection setup.
 """
 
-from sqlalchemy import Column, Integer, String, create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import Column, String, create_engine, event, inspect, text
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+import functools
 import os
 from dotenv import load_dotenv
 
+from logger import get_logger
+
 load_dotenv()
 
+logger = get_logger(__name__)
+
 # Database configuration
 Base = declarative_base()
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -26,16 +31,75 @@ class RFIDAudio(Base):
     """
 
     __tablename__ = "rfid_audio"
-    id = Column(Integer, primary_key=True)
+    id = Column(String, primary_key=True)
     file = Column(String, nullable=False)
 
 
-# Create database engine and session factory
-engine = create_engine(DATABASE_URL, echo=False)
-Session = sessionmaker(bind=engine)
+# Thread-local session registry, so the player thread and the UI thread
+# never share a session. It is bound to the engine in init_db().
+Session = scoped_session(sessionmaker(expire_on_commit=False))
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so commits don't fsync the SD card on every write."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-4096")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@functools.lru_cache(maxsize=None)
+def get_engine():
+    """
+    Create the database engine on first use and reuse it afterwards.
+
+    Returns:
+        Engine: The shared SQLAlchemy engine
+    """
+    engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    Session.configure(bind=engine)
+    return engine
+
+
+def _migrate_integer_ids(engine):
+    """
+    Convert an rfid_audio table created with an INTEGER id to a TEXT id.
+
+    Older databases stored tag IDs as integers while the application
+    always looks them up as strings.
+
+    Args:
+        engine: The engine to migrate
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table(RFIDAudio.__tablename__):
+        return
+    id_column = next(
+        c for c in inspector.get_columns(RFIDAudio.__tablename__) if c["name"] == "id"
+    )
+    if isinstance(id_column["type"], String):
+        return
+
+    logger.info("Migrating rfid_audio.id from INTEGER to TEXT")
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE rfid_audio RENAME TO rfid_audio_old"))
+        RFIDAudio.__table__.create(conn)
+        conn.execute(
+            text(
+                "INSERT INTO rfid_audio (id, file) "
+                "SELECT CAST(id AS TEXT), file FROM rfid_audio_old"
+            )
+        )
+        conn.execute(text("DROP TABLE rfid_audio_old"))
 
 
-# Create tables if they don't exist
+# Create any missing tables
 def init_db():
     """Initialize the database by creating all defined tables."""
+    engine = get_engine()
+    _migrate_integer_ids(engine)
     Base.metadata.create_all(engine)
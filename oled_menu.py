@@ -5,15 +5,18 @@ This module provides a UI for the RFID Audio Player using an OLED display
 and a rotary encoder for navigation.
 """
 
-import time
+import functools
 import os
+import queue
+import threading as th
+import time
+from collections import OrderedDict
 
 from gpiozero import Button, RotaryEncoder
 from luma.core.interface.serial import i2c
-from luma.core.render import canvas
 from luma.oled.device import sh1106
 from luma.core.error import DeviceNotFoundError
-from PIL import ImageFont
+from PIL import Image, ImageDraw, ImageFont
 
 from logger import get_logger
 from dotenv import load_dotenv
@@ -22,16 +25,110 @@ load_dotenv()
 
 logger = get_logger(__name__)
 
+# Number of rendered frames kept for reuse
+FRAME_CACHE_SIZE = 64
+
+# Shortest time between encoder-driven redraws (about 30 fps)
+MIN_REDRAW_INTERVAL = 1 / 30
+
+
+# Device tree node holding the I2C bus clock in Hz (big-endian u32)
+I2C_CLOCK_PATH = "/sys/class/i2c-dev/i2c-1/device/of_node/clock-frequency"
+
+# Reverses the bit order of a byte; SH1106 pages put the top pixel in bit 0
+_REVERSE_BITS = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+
+class PageDiffSH1106(sh1106):
+    """
+    SH1106 driver that only sends the 8-pixel-high pages that changed.
+
+    luma's sh1106 rewrites all eight pages on every display() call and
+    builds each byte in a Python loop; selection changes usually touch
+    one or two pages.
+    """
+
+    def __init__(self, serial_interface, **kwargs):
+        # Set before the base class clears the screen through display()
+        self._last_pages = {}
+        super().__init__(serial_interface, **kwargs)
+
+    def display(self, image):
+        """
+        Send the pages of an image that differ from what is on screen.
+
+        Args:
+            image: PIL image with the device's mode and size
+        """
+        assert image.mode == self.mode
+        assert image.size == self.size
+
+        image = self.preprocess(image)
+        # After transposing, each row holds one display column top to bottom
+        columns = (
+            image.transpose(Image.Transpose.TRANSPOSE)
+            .tobytes()
+            .translate(_REVERSE_BITS)
+        )
+        for page in range(self._pages):
+            data = columns[page :: self._pages]
+            if self._last_pages.get(page) == data:
+                continue
+            self.command(0xB0 + page, 0x02, 0x10)
+            self.data(list(data))
+            self._last_pages[page] = data
+
+
+@functools.lru_cache(maxsize=256)
+def _text_mask(font, text):
+    """
+    Rasterize a line of text once so later frames can blit it.
+
+    Args:
+        font: PIL font to render with
+        text (str): Text to render
+
+    Returns:
+        Image or None: 1-bit mask of the text, None if it has no pixels
+    """
+    _, _, width, height = font.getbbox(text)
+    if width <= 0 or height <= 0:
+        return None
+    mask = Image.new("1", (width, height))
+    ImageDraw.Draw(mask).text((0, 0), text, font=font, fill=1)
+    return mask
+
 
 class OLEDMenu:
     def __init__(
         self,
-        encoder_clk=os.getenv("ENCODER_CLK"),
-        encoder_dt=os.getenv("ENCODER_DT"),
-        confirm_pin=os.getenv("ENCODER_CONFIRM"),
+        encoder_clk=os.getenv("ENCODER_CLK", "27"),
+        encoder_dt=os.getenv("ENCODER_DT", "22"),
+        confirm_pin=os.getenv("ENCODER_CONFIRM", "17"),
     ):
         logger.info("Initializing OLED menu system")
         self.display_available = self._initialize_display()
+        # Describes what is currently on screen, used to skip identical redraws
+        self._last_frame_key = None
+        # Rendered frames by key, least recently used first
+        self._frame_cache = OrderedDict()
+        self._draw_lock = th.Lock()
+        # (file list, selection) of the last file menu drawn
+        self._last_file_menu = None
+
+        # Frames are pushed over I2C by a render thread; only the newest
+        # pending frame is kept so callers never block on the bus
+        self._pending = queue.Queue(maxsize=1)
+        # Screens with their static titles already drawn, copied per frame
+        self._base_frames = self._build_base_frames() if self.display_available else {}
+        # Encoder callbacks only flag a redraw; bursts of steps are
+        # coalesced into one update_display() on the redraw thread
+        self._redraw_event = th.Event()
+        if self.display_available:
+            self._render_thread = th.Thread(target=self._render_loop, daemon=True)
+            self._render_thread.start()
+            self._redraw_thread = th.Thread(target=self._redraw_loop, daemon=True)
+            self._redraw_thread.start()
 
         # Menu states
         self.menu_options = [
@@ -45,8 +142,10 @@ class OLEDMenu:
         self.yes_no_selection = 0
         self.file_selection = 0
         self.file_options = []
-        self.option_confirmed = False
+        self.confirmed = th.Event()
         self.current_menu = "main"
+        # Called instead of confirming while an RFID read is in progress
+        self.cancel_handler = None
 
         self.audio_output_options = ["Speaker", "AUX"]
         self.audio_output_selection = 0
@@ -55,20 +154,35 @@ class OLEDMenu:
         self.audio_menu_selection = 1
         self.adjusting_volume = False
 
+        # Row text for each option, unselected and selected
+        self._main_rows = self._menu_rows(self.menu_options)
+        self._yes_no_rows = self._menu_rows(self.yes_no_options)
+        self._audio_output_rows = self._menu_rows(self.audio_output_options)
+        self._audio_menu_rows = self._menu_rows(self.audio_menu_options)
+
+        # These menus have only a few states, so render them all up front
+        if self.display_available:
+            self._prerender_menus()
+
         self.volume_value = int(os.getenv("DEFAULT_VOLUME", 50))
         logger.info(f"Loaded DEFAULT_VOLUME: {self.volume_value}")
 
         try:
-            self.encoder_bounce_time = os.getenv("ENCODER_BOUNCE_TIME", 0.02)
-            self.encoder = RotaryEncoder(
-                encoder_clk, encoder_dt, bounce_time=float(self.encoder_bounce_time)
+            # Values from .env arrive as strings
+            encoder_clk, encoder_dt = int(encoder_clk), int(encoder_dt)
+            confirm_pin = int(confirm_pin)
+            self.encoder_bounce_time = float(os.getenv("ENCODER_BOUNCE_TIME", "0.05"))
+            logger.info(
+                f"Encoder pins CLK={encoder_clk} DT={encoder_dt} "
+                f"CONFIRM={confirm_pin}, bounce time {self.encoder_bounce_time}s"
             )
-            self.confirm = Button(
-                confirm_pin, bounce_time=float(self.encoder_bounce_time)
+            self.encoder = RotaryEncoder(
+                encoder_clk, encoder_dt, bounce_time=self.encoder_bounce_time
             )
+            self.confirm = Button(confirm_pin, bounce_time=self.encoder_bounce_time)
 
             self.encoder.when_rotated = self.handle_rotation
-            self.confirm.when_pressed = self.on_confirm_pressed
+            self.confirm.when_pressed = self._dispatch_confirm
             logger.info("Input controls initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize input controls: {e}")
@@ -76,8 +190,10 @@ class OLEDMenu:
 
     def _initialize_display(self):
         try:
+            self._log_i2c_clock()
             self.serial = i2c(port=1, address=0x3C)
-            self.device = sh1106(self.serial)
+            # Only send the pages of the frame that changed since the last one
+            self.device = PageDiffSH1106(self.serial)
             self.font = ImageFont.load_default()
             logger.info("OLED display initialized successfully")
             return True
@@ -88,25 +204,210 @@ class OLEDMenu:
             logger.exception(f"Unexpected error initializing OLED display: {e}")
             return False
 
-    def _safe_draw(self, draw_function):
+    @staticmethod
+    def _log_i2c_clock():
+        """
+        Log the clock the I2C bus runs at, since it caps the frame rate.
+        """
+        try:
+            with open(I2C_CLOCK_PATH, "rb") as f:
+                hz = int.from_bytes(f.read(4), "big")
+        except OSError:
+            logger.info(
+                "I2C bus clock unknown (raise it with I2C_BAUDRATE in setup.sh)"
+            )
+            return
+        logger.info(f"I2C bus clock: {hz // 1000} kHz")
+        if hz < 400000:
+            logger.warning(
+                f"I2C bus runs below 400 kHz ({hz // 1000} kHz); "
+                "rerun setup.sh to raise i2c_arm_baudrate"
+            )
+
+    def _build_base_frames(self):
+        """
+        Render the static text of each screen once.
+
+        Returns:
+            dict: Screen name -> image with that screen's fixed text drawn
+        """
+        static_text = {
+            "main": [((0, 0), "RFID Audio Player")],
+            "yes_no": [((0, 0), "Overwrite?"), ((0, 16), "Entry exists")],
+            "files": [((0, 0), "Files:")],
+            "currently_playing": [
+                ((0, 0), "Now Playing:"),
+                ((0, 48), "Press OK to return"),
+            ],
+            "audio_output": [((0, 0), "Audio Output:")],
+            "audio_menu": [((0, 0), "Audio Settings:")],
+        }
+        frames = {}
+        for name, texts in static_text.items():
+            image = Image.new(self.device.mode, self.device.size)
+            draw = ImageDraw.Draw(image)
+            for xy, label in texts:
+                draw.text(xy, label, font=self.font, fill="white")
+            frames[name] = image
+        return frames
+
+    def _safe_draw(self, draw_function, key=None, base=None):
+        """
+        Draw a frame, skipping the I2C transfer if it would be unchanged.
+
+        Args:
+            draw_function: Callable that draws the frame onto a PIL context
+            key: Hashable description of the frame content; a frame with the
+                same key as the one on screen is not redrawn
+            base: Name of a prerendered frame from _build_base_frames to
+                draw on top of instead of a blank image
+        """
         if not self.display_available:
             logger.warning("Attempted to draw while display is unavailable.")
             return
+        # The UI thread and the encoder callback thread both draw
+        with self._draw_lock:
+            if key is not None and key == self._last_frame_key:
+                return
+            try:
+                image = self._get_frame(draw_function, key, base)
+                self._submit_frame(image)
+                self._last_frame_key = key
+            except Exception as e:
+                self._last_frame_key = None
+                logger.error(f"Error during OLED drawing: {e}")
+
+    def _get_frame(self, draw_function, key, base):
+        """
+        Return the cached frame for a key, rendering it on a miss.
+
+        Must be called with _draw_lock held.
+
+        Args:
+            draw_function: Callable that draws the frame onto a PIL context
+            key: Hashable description of the frame content, or None
+            base: Name of a prerendered base frame, or None
+
+        Returns:
+            Image: The rendered frame
+        """
+        image = self._frame_cache.get(key) if key is not None else None
+        if image is not None:
+            self._frame_cache.move_to_end(key)
+            return image
+
+        if base is not None:
+            image = self._base_frames[base].copy()
+        else:
+            image = Image.new(self.device.mode, self.device.size)
+        draw_function(ImageDraw.Draw(image))
+        if key is not None:
+            self._frame_cache[key] = image
+            if len(self._frame_cache) > FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        return image
+
+    def _prerender_menus(self):
+        """Fill the frame cache with every state of the fixed selection menus."""
+        menus = [
+            ("main", self._main_rows, 16),
+            ("yes_no", self._yes_no_rows, 32),
+            ("audio_output", self._audio_output_rows, 16),
+        ]
+        with self._draw_lock:
+            for name, rows, start_y in menus:
+                for selection in range(len(rows)):
+                    try:
+                        self._get_frame(
+                            lambda draw, r=rows, s=selection, y=start_y: (
+                                self._draw_menu_items(draw, r, s, start_y=y)
+                            ),
+                            key=(name, selection),
+                            base=name,
+                        )
+                    except Exception as e:
+                        logger.error(f"Error prerendering {name} menu: {e}")
+
+    def _submit_frame(self, image):
+        """Queue a frame for the render thread, replacing any unsent frame."""
+        while True:
+            try:
+                self._pending.put_nowait(image)
+                return
+            except queue.Full:
+                try:
+                    self._pending.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _render_loop(self):
+        """Push queued frames to the display until the process exits."""
+        self._raise_render_priority()
+        while True:
+            image = self._pending.get()
+            try:
+                self.device.display(image)
+            except Exception as e:
+                self._last_frame_key = None
+                logger.error(f"Error sending frame to OLED: {e}")
+
+    def _raise_render_priority(self):
+        """
+        Let frame pushes preempt audio decoding on the calling thread.
+
+        Needs CAP_SYS_NICE (e.g. running as root); otherwise the thread
+        keeps the default scheduling. On boards with more than two cores
+        the thread is also kept on core 1, away from core 0 where most
+        interrupts land.
+        """
         try:
-            with canvas(self.device) as draw:
-                draw_function(draw)
-        except Exception as e:
-            logger.error(f"Error during OLED drawing: {e}")
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+            logger.debug("Render thread running with SCHED_FIFO priority 1")
+        except (AttributeError, OSError) as e:
+            logger.debug("Render thread keeps default scheduling: %s", e)
+        if (os.cpu_count() or 1) > 2:
+            try:
+                os.sched_setaffinity(0, {1})
+            except (AttributeError, OSError) as e:
+                logger.debug("Could not pin render thread: %s", e)
+
+    def request_redraw(self):
+        """Schedule an update_display() without drawing on the caller's thread."""
+        if self.display_available:
+            self._redraw_event.set()
+
+    def on_track_change(self):
+        """
+        Redraw after the current audio changed, if it is on screen.
+
+        Other screens ignore track changes, so status messages shown while
+        current_menu still names a menu are not overwritten.
+        """
+        if self.current_menu == "currently_playing":
+            self.request_redraw()
+
+    def _redraw_loop(self):
+        """Redraw the current menu whenever a redraw has been requested."""
+        last_redraw = 0.0
+        while True:
+            self._redraw_event.wait()
+            # Let further encoder steps accumulate into this redraw
+            remaining = MIN_REDRAW_INTERVAL - (time.monotonic() - last_redraw)
+            if remaining > 0:
+                time.sleep(remaining)
+            self._redraw_event.clear()
+            last_redraw = time.monotonic()
+            try:
+                self.update_display()
+            except Exception as e:
+                logger.error(f"Error redrawing OLED menu: {e}")
 
     def handle_rotation(self):
         """
         Handle rotary encoder rotation events.
         Now includes volume adjustment mode.
         """
-        if (
-            self.current_menu == "currently_playing"
-            or self.current_menu == "add_update"
-        ):
+        if self.current_menu in ("currently_playing", "add_update", "rfid_read"):
             self.encoder.steps = 0
             return
 
@@ -120,51 +421,53 @@ class OLEDMenu:
             ):
                 # Adjust volume
                 self.volume_value = max(0, min(100, self.volume_value + steps * 5))
-                logger.debug(f"Volume adjusted to: {self.volume_value}%")
+                logger.debug("Volume adjusted to: %s%%", self.volume_value)
             else:
-                # Regular menu navigation
-                if steps > 0:
-                    for _ in range(steps):
-                        self._change_selection(1)  # Down
-                else:
-                    for _ in range(abs(steps)):
-                        self._change_selection(-1)  # Up
+                # Regular menu navigation; positive steps move down
+                self._change_selection(steps)
 
             self.encoder.steps = 0
-            self.update_display()
+            self.request_redraw()
 
     def _change_selection(self, direction):
         """
-        Change selection based on direction.
+        Move the selection by a number of rows, wrapping around.
         Now includes audio menu selections.
+
+        Args:
+            direction (int): Rows to move; negative moves up
         """
         if self.current_menu == "main":
             self.menu_selection = (self.menu_selection + direction) % len(
                 self.menu_options
             )
             logger.debug(
-                f"Main menu selection changed to: {self.menu_options[self.menu_selection]}"
+                "Main menu selection changed to: %s",
+                self.menu_options[self.menu_selection],
             )
         elif self.current_menu == "yes_no":
             self.yes_no_selection = (self.yes_no_selection + direction) % len(
                 self.yes_no_options
             )
             logger.debug(
-                f"Yes/No selection changed to: {self.yes_no_options[self.yes_no_selection]}"
+                "Yes/No selection changed to: %s",
+                self.yes_no_options[self.yes_no_selection],
             )
         elif self.current_menu == "files" and self.file_options:
             self.file_selection = (self.file_selection + direction) % len(
                 self.file_options
             )
             logger.debug(
-                f"File selection changed to: {self.file_options[self.file_selection]}"
+                "File selection changed to: %s",
+                self.file_options[self.file_selection],
             )
         elif self.current_menu == "audio_output":
             self.audio_output_selection = (
                 self.audio_output_selection + direction
             ) % len(self.audio_output_options)
             logger.debug(
-                f"Audio output selection changed to: {self.audio_output_options[self.audio_output_selection]}"
+                "Audio output selection changed to: %s",
+                self.audio_output_options[self.audio_output_selection],
             )
         elif self.current_menu == "audio_menu":
             if not self.adjusting_volume or self.audio_menu_selection != 1:
@@ -172,132 +475,189 @@ class OLEDMenu:
                     self.audio_menu_selection + direction
                 ) % len(self.audio_menu_options)
                 logger.debug(
-                    f"Audio menu selection changed to: {self.audio_menu_options[self.audio_menu_selection]}"
+                    "Audio menu selection changed to: %s",
+                    self.audio_menu_options[self.audio_menu_selection],
                 )
 
+    def _dispatch_confirm(self):
+        """Route a confirm button press based on the current menu."""
+        if self.current_menu == "rfid_read" and self.cancel_handler:
+            self.cancel_handler()
+        else:
+            self.on_confirm_pressed()
+
     def on_confirm_pressed(self):
         """Handle confirmation"""
-        self.option_confirmed = True
-        logger.debug(f"Selection confirmed in menu: {self.current_menu}")
+        self.confirmed.set()
+        logger.debug("Selection confirmed in menu: %s", self.current_menu)
 
-    def _draw_menu_items(
-        self, draw, items, selection, start_y=16, prefix_selected=">", prefix_normal=" "
-    ):
+    def _draw_text(self, draw, xy, text):
+        """Draw white text from the rasterized text cache."""
+        mask = _text_mask(self.font, text)
+        if mask is not None:
+            draw.bitmap(xy, mask, fill="white")
+
+    @staticmethod
+    def _menu_rows(items):
+        """
+        Build the text of each menu row in both of its states.
+
+        Args:
+            items: List of items to display
+
+        Returns:
+            list: (unselected text, selected text) for each item
+        """
+        return [(f"  {item}", f"> {item}") for item in items]
+
+    def _draw_menu_items(self, draw, rows, selection, start_y=16):
         """
         Draw a list of menu items with selection indicator.
 
         Args:
             draw: PIL drawing context
-            items: List of items to display
+            rows: Row text pairs from _menu_rows
             selection: Index of selected item
             start_y: Starting Y position for first item
-            prefix_selected: Prefix for selected item
-            prefix_normal: Prefix for non-selected items
         """
-        # For file menu with many items, show a sliding window around the selection
-        if len(items) > 3 and self.current_menu == "files":
-            start_idx = max(0, min(selection, len(items) - 3))
-            visible_items = items[start_idx : start_idx + 3]
-            selection_offset = selection - start_idx
-
-            for i, item in enumerate(visible_items):
-                y_pos = start_y + (i * 12)
-                prefix = prefix_selected if i == selection_offset else prefix_normal
-                # Truncate long filenames
-                if len(item) > 18:
-                    item = item[:18]
-                draw.text((0, y_pos), f"{prefix} {item}", font=self.font, fill="white")
-        else:
-            # Standard menu display (all items visible)
-            for i, item in enumerate(items):
-                y_pos = start_y + (i * 12)
-                prefix = prefix_selected if i == selection else prefix_normal
-                draw.text((0, y_pos), f"{prefix} {item}", font=self.font, fill="white")
+        for i, (normal, selected) in enumerate(rows):
+            y_pos = start_y + (i * 12)
+            self._draw_text(draw, (0, y_pos), selected if i == selection else normal)
+
+    def _file_window_start(self, count, selection, size=3):
+        """
+        Get the first file row shown on screen.
+
+        The window only scrolls once the selection leaves it, so moving
+        within the visible rows changes just the cursor, not the names.
+
+        Args:
+            count: Number of files in the list
+            selection: Index of selected file
+            size: Number of rows that fit on screen
+
+        Returns:
+            int: Index of the first visible file
+        """
+        start = self._window_start
+        if selection < start:
+            start = selection
+        elif selection >= start + size:
+            start = selection - size + 1
+        self._window_start = max(0, min(start, count - size))
+        return self._window_start
 
     def display_menu(self):
         logger.debug("Displaying main menu")
+        # Read once; the encoder thread may change it before the draw runs
+        selection = self.menu_selection
         self._safe_draw(
-            lambda draw: (
-                draw.text((0, 0), "RFID Audio Player", font=self.font, fill="white"),
-                self._draw_menu_items(draw, self.menu_options, self.menu_selection),
-            )
+            lambda draw: self._draw_menu_items(draw, self._main_rows, selection),
+            key=("main", selection),
+            base="main",
         )
 
     def display_yes_no_menu(self):
         logger.debug("Displaying yes/no menu")
+        selection = self.yes_no_selection
         self._safe_draw(
-            lambda draw: (
-                draw.text((0, 0), "Overwrite?", font=self.font, fill="white"),
-                draw.text((0, 16), "Entry exists", font=self.font, fill="white"),
-                self._draw_menu_items(
-                    draw, self.yes_no_options, self.yes_no_selection, start_y=32
-                ),
-            )
+            lambda draw: self._draw_menu_items(
+                draw, self._yes_no_rows, selection, start_y=32
+            ),
+            key=("yes_no", selection),
+            base="yes_no",
         )
 
     def display_file_menu(self, files):
-        logger.debug(f"Displaying file menu with {len(files)} files")
+        # Skip the window slicing and draw lock when this exact list and
+        # selection is already on screen
+        if (
+            self._last_file_menu is not None
+            and self._last_file_menu[0] is files
+            and self._last_file_menu[1] == self.file_selection
+            and self._last_frame_key is not None
+            and self._last_frame_key[0] == "files"
+        ):
+            return
+        self._last_file_menu = (files, self.file_selection)
+
+        logger.debug("Displaying file menu with %s files", len(files))
+        if files is self._file_options:
+            labels, rows = self._file_labels, self._file_rows
+        else:
+            labels = self._truncate_labels(files)
+            rows = self._menu_rows(labels)
+
+        # Key on the rows actually shown, not the whole list, so frames can
+        # be reused and the key stays small for large folders
+        if len(labels) > 3 and self.current_menu == "files":
+            start = self._file_window_start(len(labels), self.file_selection)
+            visible, rows = labels[start : start + 3], rows[start : start + 3]
+        else:
+            start, visible = 0, labels
+        offset = self.file_selection - start
         self._safe_draw(
-            lambda draw: (
-                draw.text((0, 0), "Files:", font=self.font, fill="white"),
-                self._draw_menu_items(draw, files, self.file_selection),
-            )
+            lambda draw: self._draw_menu_items(draw, rows, offset),
+            key=("files", tuple(visible), offset, self.current_menu),
+            base="files",
         )
 
     def display_current_audio(self, current_audio):
-        logger.debug(f"Displaying current audio: {current_audio}")
+        logger.debug("Displaying current audio: %s", current_audio)
 
         def draw_callback(draw):
-            draw.text((0, 0), "Now Playing:", font=self.font, fill="white")
             if current_audio:
                 if len(current_audio) > 18:
-                    draw.text((0, 16), current_audio[:18], font=self.font, fill="white")
-                    draw.text(
-                        (0, 28), current_audio[18:36], font=self.font, fill="white"
-                    )
+                    self._draw_text(draw, (0, 16), current_audio[:18])
+                    self._draw_text(draw, (0, 28), current_audio[18:36])
                 else:
-                    draw.text((0, 16), current_audio, font=self.font, fill="white")
+                    self._draw_text(draw, (0, 16), current_audio)
             else:
-                draw.text((0, 16), "No audio playing", font=self.font, fill="white")
-            draw.text((0, 48), "Press OK to return", font=self.font, fill="white")
+                self._draw_text(draw, (0, 16), "No audio playing")
 
-        self._safe_draw(draw_callback)
+        self._safe_draw(
+            draw_callback,
+            key=("currently_playing", current_audio),
+            base="currently_playing",
+        )
 
     def display_audio_output_menu(self):
         logger.debug("Displaying audio output menu")
+        selection = self.audio_output_selection
         self._safe_draw(
-            lambda draw: (
-                draw.text((0, 0), "Audio Output:", font=self.font, fill="white"),
-                self._draw_menu_items(
-                    draw, self.audio_output_options, self.audio_output_selection
-                ),
-            )
+            lambda draw: self._draw_menu_items(
+                draw, self._audio_output_rows, selection
+            ),
+            key=("audio_output", selection),
+            base="audio_output",
         )
 
     def display_message(self, message):
-        logger.debug(f"Displaying message: {message[:20]}...")
+        logger.debug("Displaying message: %s...", message[:20])
 
         def draw_callback(draw):
-            lines = self._wrap_text_to_lines(message, max_chars=18)
+            lines = self._wrap_text_to_lines(message, self.font, self.device.width)
             for i, line in enumerate(lines[:4]):
-                draw.text((0, i * 16), line, font=self.font, fill="white")
+                self._draw_text(draw, (0, i * 16), line)
 
-        self._safe_draw(draw_callback)
+        self._safe_draw(draw_callback, key=("message", message))
 
     def display_audio_menu(self):
         logger.debug("Displaying audio settings menu")
+        # Snapshot the state so the cache key and the frame always agree,
+        # even if the encoder thread changes it before the draw runs
+        selection = self.audio_menu_selection
+        volume = self.volume_value
+        adjusting = self.adjusting_volume
+        output_selection = self.audio_output_selection
 
         def draw_callback(draw):
-            draw.text((0, 0), "Audio Settings:", font=self.font, fill="white")
-            for i, item in enumerate(self.audio_menu_options):
-                y_pos = 16 + (i * 12)
-                prefix = ">" if i == self.audio_menu_selection else " "
-                draw.text((0, y_pos), f"{prefix} {item}", font=self.font, fill="white")
+            self._draw_menu_items(draw, self._audio_menu_rows, selection)
 
-            if self.audio_menu_selection == 1:
+            if selection == 1:
                 slider_y = 16 + 12 + 4
                 slider_width = 48
-                filled_width = int((self.volume_value / 100) * slider_width)
+                filled_width = int((volume / 100) * slider_width)
 
                 draw.rectangle(
                     (50, slider_y, 50 + slider_width, slider_y + 6), outline="white"
@@ -306,54 +666,94 @@ class OLEDMenu:
                 if filled_width > 0:
                     draw.rectangle(
                         (50, slider_y, 50 + filled_width, slider_y + 6),
-                        fill="white" if self.adjusting_volume else "white",
+                        fill="white" if adjusting else "white",
                         outline="white",
                     )
-                draw.text(
-                    (105, slider_y),
-                    f"{self.volume_value}%",
-                    font=self.font,
-                    fill="white",
-                )
+                self._draw_text(draw, (105, slider_y), f"{volume}%")
 
-            if self.audio_menu_selection == 2:
-                current_device = self.audio_output_options[self.audio_output_selection]
-                draw.text(
-                    (60, 30 + 24), f"< {current_device} >", font=self.font, fill="white"
-                )
+            if selection == 2:
+                current_device = self.audio_output_options[output_selection]
+                self._draw_text(draw, (60, 30 + 24), f"< {current_device} >")
 
-        self._safe_draw(draw_callback)
+        self._safe_draw(
+            draw_callback,
+            key=("audio_menu", selection, volume, adjusting, output_selection),
+            base="audio_menu",
+        )
 
-    def _wrap_text_to_lines(self, text, max_chars=18):
+    @property
+    def file_options(self):
+        """list: Filenames offered in the file menu."""
+        return self._file_options
+
+    @file_options.setter
+    def file_options(self, files):
+        # get_files_in_folder returns the same list while the folder is
+        # unchanged, so its labels can be kept
+        if files is getattr(self, "_file_options", None):
+            return
+        self._file_options = files
+        self._window_start = 0
+        # Truncate once here instead of on every redraw
+        self._file_labels = self._truncate_labels(files)
+        self._file_rows = self._menu_rows(self._file_labels)
+
+    @staticmethod
+    def _truncate_labels(files, max_chars=18):
+        """
+        Cut filenames down to what fits on one display line.
+
+        Args:
+            files (list): Filenames to shorten
+            max_chars (int): Maximum characters per line
+
+        Returns:
+            list: Filenames truncated to max_chars
+        """
+        return [f[:max_chars] if len(f) > max_chars else f for f in files]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _wrap_text_to_lines(text, font, max_width=128):
         """
         Split text into lines with word wrapping.
 
+        Lines are measured in pixels with the display font, so proportional
+        fonts use the full width of the screen. Results are cached since the
+        same status messages are shown often.
+
         Args:
             text (str): Text to wrap
-            max_chars (int): Maximum characters per line
+            font: PIL font the text will be drawn with
+            max_width (int): Maximum line width in pixels
 
         Returns:
-            list: List of wrapped text lines
+            tuple: Wrapped text lines
         """
-        words = text.split()
+        space_width = font.getlength(" ")
         lines = []
         current_line = []
+        current_width = 0
 
-        for word in words:
-            # If adding this word exceeds max length
-            if len(" ".join(current_line + [word])) <= max_chars:
+        for word in text.split():
+            word_width = font.getlength(word)
+            # Width of the word plus the space before it
+            added = word_width + (space_width if current_line else 0)
+            if current_width + added <= max_width:
                 current_line.append(word)
+                current_width += added
             else:
                 # Add the current line and start a new one
                 if current_line:
                     lines.append(" ".join(current_line))
                 current_line = [word]
+                current_width = word_width
 
         # Add the last line if not empty
         if current_line:
             lines.append(" ".join(current_line))
 
-        return lines
+        return tuple(lines)
 
     def update_display(self):
         """Update the display based on current menu state."""
@@ -383,13 +783,10 @@ class OLEDMenu:
         Returns:
             bool: True if confirmed, False if timed out
         """
-        logger.debug(f"Waiting for confirmation with timeout: {timeout}s")
-        self.option_confirmed = False
-        start_time = time.time()
-        while not self.option_confirmed:
-            if timeout and (time.time() - start_time > timeout):
-                logger.debug("Confirmation wait timed out")
-                return False
-            time.sleep(0.1)
+        logger.debug("Waiting for confirmation with timeout: %ss", timeout)
+        self.confirmed.clear()
+        if not self.confirmed.wait(timeout):
+            logger.debug("Confirmation wait timed out")
+            return False
         logger.debug("Received confirmation")
         return True
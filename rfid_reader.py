@@ -37,7 +37,7 @@ class RFIDReader:
         self.reader_lock = Lock()
         self.consecutive_errors = 0
         self.max_consecutive_errors = int(os.getenv("MAX_CONSECUTIVE_ERRORS"))
-        self.last_successful_read_time = time.time()
+        self.last_successful_read_time = time.monotonic()
         self.reinit_interval = int(os.getenv("REINIT_INTERVAL"))
 
     def _reset_reader(self):
@@ -76,22 +76,22 @@ class RFIDReader:
     def _update_success_metrics(self, id_val):
         """Update tracking metrics on successful read"""
         if id_val is not None:
-            logger.debug(f"Read successful: {id_val}")
+            logger.debug("Read successful: %s", id_val)
             self.consecutive_errors = 0
-            self.last_successful_read_time = time.time()
+            self.last_successful_read_time = time.monotonic()
 
     def read_tag(self):
         """
         Read an RFID tag and return its ID.
 
         Returns:
-            tuple: (id, text) from the RFID tag
+            tuple: (id, text) from the RFID tag, with the id as a string
         """
         with self.reader_lock:
             try:
                 id_val, text = self.reader.read()
                 self._update_success_metrics(id_val)
-                return id_val, text
+                return str(id_val), text
             except Exception as e:
                 return self._handle_read_error(e)
 
@@ -100,26 +100,55 @@ class RFIDReader:
         Read an RFID tag without blocking if no tag is present.
 
         Returns:
-            tuple: (id, text) from the RFID tag, or (None, None) if no tag
+            tuple: (id, text) from the RFID tag with the id as a string,
+                or (None, None) if no tag
         """
-        # Check if we need a proactive reset
-        if time.time() - self.last_successful_read_time > self.reinit_interval:
-            self._reset_reader()
-            self.last_successful_read_time = time.time()
+        self._check_proactive_reset()
 
         with self.reader_lock:
             try:
                 id_val, text = self.reader.read_no_block()
+                if id_val is None:
+                    return None, text
                 self._update_success_metrics(id_val)
-                return id_val, text
+                return str(id_val), text
             except Exception as e:
                 return self._handle_read_error(e, "read_no_block")
 
+    def read_tag_id_no_block(self):
+        """
+        Read only the ID of an RFID tag without blocking.
+
+        Unlike read_tag_no_block this skips authenticating and reading the
+        tag's data block, so a poll is just the request and anticollision
+        exchange on the SPI bus.
+
+        Returns:
+            str or None: The tag ID as a string, or None if no tag
+        """
+        self._check_proactive_reset()
+
+        with self.reader_lock:
+            try:
+                id_val = self.reader.read_id_no_block()
+                if id_val is None:
+                    return None
+                self._update_success_metrics(id_val)
+                return str(id_val)
+            except Exception as e:
+                return self._handle_read_error(e, "read_id_no_block")[0]
+
+    def _check_proactive_reset(self):
+        """Reset the reader if nothing has been read for reinit_interval."""
+        if time.monotonic() - self.last_successful_read_time > self.reinit_interval:
+            self._reset_reader()
+            self.last_successful_read_time = time.monotonic()
+
     def read_with_timeout(
         self,
-        timeout=os.getenv("READ_TIMEOUT"),
+        timeout=float(os.getenv("READ_TIMEOUT", "30")),
         check_interval=0.1,
-        max_retries=os.getenv("READ_WITH_TIMEOUT_MAX_RETRIES"),
+        max_retries=int(os.getenv("READ_WITH_TIMEOUT_MAX_RETRIES", "3")),
     ):
         """
         Read an RFID tag with timeout and error handling.
@@ -130,15 +159,16 @@ class RFIDReader:
             max_retries (int): Maximum number of retries on error
 
         Returns:
-            tuple: (id, text) from the RFID tag, or (None, None) if timeout/cancelled
+            tuple: (id, text) from the RFID tag with the id as a string,
+                or (None, None) if timeout/cancelled
         """
         logger.info(f"Starting RFID read with {timeout}s timeout")
         self.cancel_event.clear()
-        start_time = time.time()
+        start_time = time.monotonic()
         retries = 0
 
         while True:
-            if timeout and (time.time() - start_time > timeout):
+            if timeout and (time.monotonic() - start_time > timeout):
                 logger.info("RFID read timeout")
                 return None, None
 
@@ -152,7 +182,7 @@ class RFIDReader:
                     id_val, text = self.reader.read_no_block()
                     if id_val is not None:
                         self._update_success_metrics(id_val)
-                        return id_val, text
+                        return str(id_val), text
                 except Exception as e:
                     logger.error(f"RFID read error: {e}")
                     retries += 1
@@ -163,7 +193,8 @@ class RFIDReader:
 
                     self._reset_reader()
 
-            time.sleep(check_interval)
+            # Sleep between polls, but wake immediately on cancel_read()
+            self.cancel_event.wait(check_interval)
 
     def cancel_read(self):
         """Cancel an ongoing read_with_timeout operation."""
@@ -104,6 +104,15 @@ if [ -f "$CONFIG_FILE" ]; then
     else
         echo "dtoverlay=hifiberry-dac,card=1" | sudo tee -a "$CONFIG_FILE"
     fi
+
+    # Run I2C at 400 kHz (SH1106 fast mode) so OLED frames go out faster.
+    # Many modules also work at 1 MHz: I2C_BAUDRATE=1000000 ./setup.sh
+    I2C_BAUDRATE="${I2C_BAUDRATE:-400000}"
+    if grep -q "^dtparam=i2c_arm_baudrate=" "$CONFIG_FILE"; then
+        sudo sed -i "s/^dtparam=i2c_arm_baudrate=.*/dtparam=i2c_arm_baudrate=$I2C_BAUDRATE/" "$CONFIG_FILE"
+    else
+        echo "dtparam=i2c_arm_baudrate=$I2C_BAUDRATE" | sudo tee -a "$CONFIG_FILE"
+    fi
 else
     echo "Warning: Could not find config.txt file. You'll need to manually configure ALSA settings."
 fi
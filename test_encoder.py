@@ -1,5 +1,5 @@
 import os
-import time
+import signal
 from gpiozero import Button, RotaryEncoder
 from dotenv import load_dotenv
 
@@ -28,21 +28,20 @@ def test_encoder():
 
         last_steps = 0
 
-        while True:
+        def on_rotated():
+            nonlocal last_steps
             current_steps = encoder.steps
-            if current_steps != last_steps:
-                print(
-                    f"Rotated! Steps: {current_steps} (Delta: {current_steps - last_steps})"
-                )
-                last_steps = current_steps
-
-            if button.is_pressed:
-                print("Button Pressed!")
-                while button.is_pressed:
-                    time.sleep(0.1)  # Wait for release
-                print("Button Released")
-
-            time.sleep(0.01)
+            print(
+                f"Rotated! Steps: {current_steps} (Delta: {current_steps - last_steps})"
+            )
+            last_steps = current_steps
+
+        # React to GPIO edges instead of polling the pins
+        encoder.when_rotated = on_rotated
+        button.when_pressed = lambda: print("Button Pressed!")
+        button.when_released = lambda: print("Button Released")
+
+        signal.pause()
 
     except KeyboardInterrupt:
         print("\nTest cancelled by user.")